@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """Pytest tests for feature_handlers.py - Log viewer, settings, and feature handlers."""
 
+import os
 from unittest.mock import Mock, patch
 
 import flet as ft
 import pytest
 
 from uv_forger.core.state import AppState
+from uv_forger.handlers.feature_handlers import _load_markdown, _read_markdown
 from uv_forger.handlers.ui_handler import Handlers
 
 
@@ -212,3 +214,76 @@ def test_update_metadata_summary_empty(handler_setup):
     handlers._update_metadata_summary()
 
     assert controls.metadata_summary.value == ""
+
+
+# ========== Markdown Loading Tests ==========
+
+
+def test_load_markdown_reuses_cached_text(tmp_path):
+    """Repeat loads of an unchanged file return the cached text."""
+    md_file = tmp_path / "HELP.md"
+    md_file.write_text("# Help", encoding="utf-8")
+    _read_markdown.cache_clear()
+
+    assert _load_markdown(md_file) == "# Help"
+    assert _load_markdown(md_file) == "# Help"
+    assert _read_markdown.cache_info().hits == 1
+
+
+def test_load_markdown_rereads_after_modification(tmp_path):
+    """A changed modification time invalidates the cached text."""
+    md_file = tmp_path / "HELP.md"
+    md_file.write_text("# Old", encoding="utf-8")
+    assert _load_markdown(md_file) == "# Old"
+
+    md_file.write_text("# New", encoding="utf-8")
+    stat = md_file.stat()
+    os.utime(md_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _load_markdown(md_file) == "# New"
+
+
+@pytest.mark.asyncio
+async def test_prewarm_markdown_fills_cache(handler_setup, tmp_path):
+    """prewarm_markdown loads each markdown file into the cache."""
+    handlers, page, controls, state = handler_setup
+
+    files = {}
+    for attr in ("HELP_FILE", "APP_CHEAT_SHEET_FILE", "ABOUT_FILE"):
+        files[attr] = tmp_path / f"{attr}.md"
+        files[attr].write_text(f"# {attr}", encoding="utf-8")
+    _read_markdown.cache_clear()
+
+    with patch.multiple("uv_forger.handlers.feature_handlers", **files):
+        await handlers.prewarm_markdown()
+
+    assert _read_markdown.cache_info().currsize == 3
+
+
+@pytest.mark.asyncio
+async def test_prewarm_markdown_skips_missing_files(handler_setup, tmp_path):
+    """prewarm_markdown ignores files that don't exist."""
+    handlers, page, controls, state = handler_setup
+
+    missing = tmp_path / "missing.md"
+    _read_markdown.cache_clear()
+    with patch.multiple(
+        "uv_forger.handlers.feature_handlers",
+        HELP_FILE=missing,
+        APP_CHEAT_SHEET_FILE=missing,
+        ABOUT_FILE=missing,
+    ):
+        await handlers.prewarm_markdown()
+
+    assert _read_markdown.cache_info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_prewarm_markdown_reraises_unexpected_errors(handler_setup):
+    """prewarm_markdown only swallows OSError."""
+    handlers, page, controls, state = handler_setup
+
+    with patch(
+        "uv_forger.handlers.feature_handlers._load_markdown",
+        side_effect=ValueError("boom"),
+    ), pytest.raises(ValueError, match="boom"):
+        await handlers.prewarm_markdown()
@@ -3,18 +3,43 @@
 
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 from uv_forger.core.constants import DEFAULT_PYTHON_VERSION
 from uv_forger.core.state import AppState
+from uv_forger.handlers import feature_handlers
 from uv_forger.handlers.ui_handler import Handlers
 from uv_forger.ui.dialog_data import (
     OTHER_PROJECT_CHECKBOX_LABEL,
     UI_PROJECT_CHECKBOX_LABEL,
 )
 
+# Keyboard events are read-only in the handlers, so tests share these.
+CTRL_ENTER_EVT = SimpleNamespace(key="Enter", ctrl=True, meta=False, shift=False)
+META_ENTER_EVT = SimpleNamespace(key="Enter", ctrl=False, meta=True, shift=False)
+ESCAPE_EVT = SimpleNamespace(key="Escape", ctrl=False, meta=False, shift=False)
+CTRL_ESCAPE_EVT = SimpleNamespace(key="Escape", ctrl=True, meta=False, shift=False)
+CMD_SLASH_EVT = SimpleNamespace(key="/", ctrl=False, meta=True, shift=False)
+CTRL_SLASH_EVT = SimpleNamespace(key="/", ctrl=True, meta=False, shift=False)
+
+
+class FakeMarkdownFile:
+    """Stand-in for a bundled markdown Path (HELP_FILE, ABOUT_FILE, ...)"""
+    def __init__(self, text="", error=None):
+        self.text = text
+        self.error = error
+
+    def stat(self):
+        return SimpleNamespace(st_mtime_ns=0)
+
+    def read_text(self, encoding=None):
+        if self.error is not None:
+            raise self.error
+        return self.text
+
 
 class MockControl:
     """Mock Flet control"""
@@ -36,8 +61,7 @@ class MockControl:
 class MockContainer:
     """Mock Flet container"""
     def __init__(self):
-        self.content = Mock()
-        self.content.controls = []
+        self.content = SimpleNamespace(controls=[])
         self.border = None
 
 
@@ -54,19 +78,20 @@ class MockPage:
         self.updated = False
         self.overlay = []
         self.appbar = None
-        self.bottom_appbar = Mock()
-        self.bottom_appbar.bgcolor = None
+        self.bottom_appbar = SimpleNamespace(bgcolor=None)
         self.theme_mode = None
-        self.window = Mock()
+        self.window = SimpleNamespace()
         self.opened_controls = []
+        self.last_opened = None
         self.route = "/"
-        self.views = [Mock()]  # simulate the default home view
+        self.views = [SimpleNamespace()]  # simulate the default home view
 
     def update(self):
         self.updated = True
 
     def show_dialog(self, control):
         self.opened_controls.append(control)
+        self.last_opened = control
 
 
 class MockControls:
@@ -98,7 +123,7 @@ class MockControls:
         self.build_project_button = MockControl()
         self.reset_button = MockControl()
         self.exit_button = MockControl()
-        self.theme_toggle_button = Mock(icon=None)
+        self.theme_toggle_button = SimpleNamespace(icon=None)
         self.about_menu_item = MockControl()
         self.help_menu_item = MockControl()
         self.app_cheat_sheet_menu_item = MockControl()
@@ -1066,6 +1091,19 @@ def test_set_validation_icon_none(mock_handlers):
     assert field.suffix is None
 
 
+def test_set_validation_icon_reuses_existing_icon(mock_handlers):
+    """Test _set_validation_icon updates the field's icon in place"""
+    field = MockControl()
+    Handlers._set_validation_icon(field, True)
+    icon = field.suffix
+    Handlers._set_validation_icon(field, False)
+    assert field.suffix is icon
+    assert field.suffix.color == "red"
+    Handlers._set_validation_icon(field, True)
+    assert field.suffix is icon
+    assert field.suffix.color == "green"
+
+
 @pytest.mark.asyncio
 async def test_on_path_change_sets_valid_icon(mock_handlers):
     """Test on_path_change sets icon when path is valid"""
@@ -1331,10 +1369,7 @@ async def test_keyboard_ctrl_enter_triggers_build(mock_handlers):
     state.name_valid = True
     controls.build_project_button.disabled = False
 
-    mock_event = Mock()
-    mock_event.key = "Enter"
-    mock_event.ctrl = True
-    mock_event.meta = False
+    mock_event = CTRL_ENTER_EVT
 
     with patch.object(handlers, 'on_build_project') as mock_build:
         await handlers.on_keyboard_event(mock_event)
@@ -1350,10 +1385,7 @@ async def test_keyboard_meta_enter_triggers_build(mock_handlers):
     state.name_valid = True
     controls.build_project_button.disabled = False
 
-    mock_event = Mock()
-    mock_event.key = "Enter"
-    mock_event.ctrl = False
-    mock_event.meta = True
+    mock_event = META_ENTER_EVT
 
     with patch.object(handlers, 'on_build_project') as mock_build:
         await handlers.on_keyboard_event(mock_event)
@@ -1369,10 +1401,7 @@ async def test_keyboard_enter_ignored_when_invalid(mock_handlers):
     state.name_valid = False
     controls.build_project_button.disabled = True
 
-    mock_event = Mock()
-    mock_event.key = "Enter"
-    mock_event.ctrl = True
-    mock_event.meta = False
+    mock_event = CTRL_ENTER_EVT
 
     with patch.object(handlers, 'on_build_project') as mock_build:
         await handlers.on_keyboard_event(mock_event)
@@ -1388,10 +1417,7 @@ async def test_keyboard_enter_ignored_when_button_disabled(mock_handlers):
     state.name_valid = True
     controls.build_project_button.disabled = True  # Build in progress
 
-    mock_event = Mock()
-    mock_event.key = "Enter"
-    mock_event.ctrl = True
-    mock_event.meta = False
+    mock_event = CTRL_ENTER_EVT
 
     with patch.object(handlers, 'on_build_project') as mock_build:
         await handlers.on_keyboard_event(mock_event)
@@ -1407,10 +1433,7 @@ async def test_keyboard_other_keys_ignored(mock_handlers):
     state.name_valid = True
     controls.build_project_button.disabled = False
 
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = True
-    mock_event.meta = False
+    mock_event = CTRL_ESCAPE_EVT
 
     with patch.object(handlers, 'on_build_project') as mock_build:
         await handlers.on_keyboard_event(mock_event)
@@ -1792,13 +1815,14 @@ def test_collect_state_packages_builtin_framework(mock_handlers):
 
 
 @pytest.mark.asyncio
-async def test_on_about_click_opens_dialog(mock_handlers):
+async def test_on_about_click_opens_dialog(mock_handlers, monkeypatch):
     """Test on_about_click loads ABOUT.md and opens a dialog."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.ABOUT_FILE") as mock_file:
-        mock_file.read_text.return_value = "# About\nTest content"
-        await handlers.on_about_click(None)
+    monkeypatch.setattr(
+        feature_handlers, "ABOUT_FILE", FakeMarkdownFile("# About\nTest content")
+    )
+    await handlers.on_about_click(None)
 
     assert len(page.overlay) == 1
     dialog = page.overlay[0]
@@ -1807,49 +1831,45 @@ async def test_on_about_click_opens_dialog(mock_handlers):
 
 
 @pytest.mark.asyncio
-async def test_on_about_click_handles_missing_file(mock_handlers):
+async def test_on_about_click_handles_missing_file(mock_handlers, monkeypatch):
     """Test on_about_click handles missing ABOUT.md gracefully."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.ABOUT_FILE") as mock_file:
-        mock_file.read_text.side_effect = FileNotFoundError("not found")
-        await handlers.on_about_click(None)
+    monkeypatch.setattr(
+        feature_handlers,
+        "ABOUT_FILE",
+        FakeMarkdownFile(error=FileNotFoundError("not found")),
+    )
+    await handlers.on_about_click(None)
 
     # Dialog should still be opened with fallback content
     assert len(page.overlay) == 1
     assert page.overlay[0].open is True
 
 
-@pytest.mark.asyncio
-async def test_on_about_internal_link_help(mock_handlers):
-    """Test About dialog internal link navigates to Help dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.ABOUT_FILE") as mock_file:
-        mock_file.read_text.return_value = "# About\n[Help](app://help)"
-        await handlers.on_about_click(None)
-
-    about_dialog = page.overlay[0]
-
-    # Extract the on_tap_link handler from the Markdown widget
-    md_widget = about_dialog.content.content.controls[0]
-    assert md_widget.on_tap_link is not None
-
-
-# ========== Help Dialog Internal Link Tests ==========
+# ========== Markdown Dialog Internal Link Tests ==========
 
 
 @pytest.mark.asyncio
-async def test_help_dialog_internal_link_about(mock_handlers):
-    """Test Help dialog internal link navigates to About dialog."""
+@pytest.mark.parametrize("opener,file_attr,content", [
+    ("on_about_click", "ABOUT_FILE", "# About\n[Help](app://help)"),
+    ("on_about_click", "ABOUT_FILE", "# About\n[App Cheat Sheet](app://app-cheat-sheet)"),
+    ("on_help_click", "HELP_FILE", "# Help\n[About](app://about)"),
+    ("on_help_click", "HELP_FILE", "# Help\n[App Cheat Sheet](app://app-cheat-sheet)"),
+    ("on_app_cheat_sheet_click", "APP_CHEAT_SHEET_FILE", "# App\n[Help](app://help)"),
+    ("on_app_cheat_sheet_click", "APP_CHEAT_SHEET_FILE", "# App\n[About](app://about)"),
+])
+async def test_markdown_dialog_internal_links(
+    mock_handlers, monkeypatch, opener, file_attr, content
+):
+    """Test markdown dialogs wire an on_tap_link handler for internal links."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.HELP_FILE") as mock_file:
-        mock_file.read_text.return_value = "# Help\n[About](app://about)"
-        await handlers.on_help_click(None)
+    monkeypatch.setattr(feature_handlers, file_attr, FakeMarkdownFile(content))
+    await getattr(handlers, opener)(None)
 
-    help_dialog = page.overlay[0]
-    md_widget = help_dialog.content.content.controls[0]
+    # Extract the on_tap_link handler from the Markdown widget
+    md_widget = page.overlay[0].content.content.controls[0]
     assert md_widget.on_tap_link is not None
 
 
@@ -1869,10 +1889,7 @@ async def test_escape_closes_active_dialog(mock_handlers):
 
     state.active_dialog = close_dialog
 
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = False
-    mock_event.meta = False
+    mock_event = ESCAPE_EVT
 
     with patch.object(handlers, "on_exit") as mock_exit:
         await handlers.on_keyboard_event(mock_event)
@@ -1888,10 +1905,7 @@ async def test_escape_triggers_exit_when_no_active_dialog(mock_handlers):
 
     assert state.active_dialog is None
 
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = False
-    mock_event.meta = False
+    mock_event = ESCAPE_EVT
 
     with patch.object(handlers, "on_exit") as mock_exit:
         await handlers.on_keyboard_event(mock_event)
@@ -1899,115 +1913,55 @@ async def test_escape_triggers_exit_when_no_active_dialog(mock_handlers):
 
 
 @pytest.mark.asyncio
-async def test_help_dialog_sets_active_dialog(mock_handlers):
-    """Test opening Help dialog sets state.active_dialog."""
+@pytest.mark.parametrize("opener,file_attr", [
+    ("on_help_click", "HELP_FILE"),
+    ("on_app_cheat_sheet_click", "APP_CHEAT_SHEET_FILE"),
+    ("on_about_click", "ABOUT_FILE"),
+])
+async def test_markdown_dialog_active_dialog_lifecycle(
+    mock_handlers, monkeypatch, opener, file_attr
+):
+    """Test opening a markdown dialog sets state.active_dialog and closing clears it."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.HELP_FILE") as mock_file:
-        mock_file.read_text.return_value = "# Help\nTest"
-        await handlers.on_help_click(None)
+    monkeypatch.setattr(feature_handlers, file_attr, FakeMarkdownFile("# Title\nTest"))
+    await getattr(handlers, opener)(None)
 
-    assert state.active_dialog is not None
     assert callable(state.active_dialog)
-
-
-@pytest.mark.asyncio
-async def test_help_dialog_close_clears_active_dialog(mock_handlers):
-    """Test closing Help dialog clears state.active_dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.HELP_FILE") as mock_file:
-        mock_file.read_text.return_value = "# Help\nTest"
-        await handlers.on_help_click(None)
-
-    assert state.active_dialog is not None
     # Call the close callback
     state.active_dialog()
     assert state.active_dialog is None
 
 
 @pytest.mark.asyncio
-async def test_app_cheat_sheet_dialog_sets_active_dialog(mock_handlers):
-    """Test opening App Cheat Sheet dialog sets state.active_dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.APP_CHEAT_SHEET_FILE") as mock_file:
-        mock_file.read_text.return_value = "# App\nTest"
-        await handlers.on_app_cheat_sheet_click(None)
-
-    assert state.active_dialog is not None
-    assert callable(state.active_dialog)
-
-
-@pytest.mark.asyncio
-async def test_app_cheat_sheet_close_clears_active_dialog(mock_handlers):
-    """Test closing App Cheat Sheet dialog clears state.active_dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.APP_CHEAT_SHEET_FILE") as mock_file:
-        mock_file.read_text.return_value = "# App\nTest"
-        await handlers.on_app_cheat_sheet_click(None)
-
-    state.active_dialog()
-    assert state.active_dialog is None
-
-
-@pytest.mark.asyncio
-async def test_app_cheat_sheet_file_not_found(mock_handlers):
+async def test_app_cheat_sheet_file_not_found(mock_handlers, monkeypatch):
     """Test App Cheat Sheet handles missing file gracefully."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.APP_CHEAT_SHEET_FILE") as mock_file:
-        mock_file.read_text.side_effect = FileNotFoundError("not found")
-        await handlers.on_app_cheat_sheet_click(None)
-
-    assert state.active_dialog is not None
-
-
-@pytest.mark.asyncio
-async def test_about_dialog_sets_active_dialog(mock_handlers):
-    """Test opening About dialog sets state.active_dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.ABOUT_FILE") as mock_file:
-        mock_file.read_text.return_value = "# About\nTest"
-        await handlers.on_about_click(None)
+    monkeypatch.setattr(
+        feature_handlers,
+        "APP_CHEAT_SHEET_FILE",
+        FakeMarkdownFile(error=FileNotFoundError("not found")),
+    )
+    await handlers.on_app_cheat_sheet_click(None)
 
     assert state.active_dialog is not None
-    assert callable(state.active_dialog)
-
-
-@pytest.mark.asyncio
-async def test_about_dialog_close_clears_active_dialog(mock_handlers):
-    """Test closing About dialog clears state.active_dialog."""
-    handlers, page, controls, state = mock_handlers
-
-    with patch("uv_forger.handlers.feature_handlers.ABOUT_FILE") as mock_file:
-        mock_file.read_text.return_value = "# About\nTest"
-        await handlers.on_about_click(None)
-
-    state.active_dialog()
-    assert state.active_dialog is None
 
 
 @pytest.mark.asyncio
-async def test_escape_closes_help_dialog_end_to_end(mock_handlers):
+async def test_escape_closes_help_dialog_end_to_end(mock_handlers, monkeypatch):
     """Test Escape key closes an open Help dialog end-to-end."""
     handlers, page, controls, state = mock_handlers
 
-    with patch("uv_forger.handlers.feature_handlers.HELP_FILE") as mock_file:
-        mock_file.read_text.return_value = "# Help\nTest"
-        await handlers.on_help_click(None)
+    monkeypatch.setattr(feature_handlers, "HELP_FILE", FakeMarkdownFile("# Help\nTest"))
+    await handlers.on_help_click(None)
 
     help_dialog = page.overlay[0]
     assert help_dialog.open is True
     assert state.active_dialog is not None
 
     # Press Escape
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = False
-    mock_event.meta = False
+    mock_event = ESCAPE_EVT
 
     with patch.object(handlers, "on_exit") as mock_exit:
         await handlers.on_keyboard_event(mock_event)
@@ -2030,10 +1984,7 @@ async def test_escape_closes_exit_confirm_dialog(mock_handlers):
     assert state.active_dialog is not None
 
     # Press Escape — should dismiss the confirm dialog, not open another
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = False
-    mock_event.meta = False
+    mock_event = ESCAPE_EVT
 
     await handlers.on_keyboard_event(mock_event)
     assert state.active_dialog is None
@@ -2049,10 +2000,7 @@ async def test_escape_closes_reset_confirm_dialog(mock_handlers):
     assert state.active_dialog is not None
 
     # Press Escape
-    mock_event = Mock()
-    mock_event.key = "Escape"
-    mock_event.ctrl = False
-    mock_event.meta = False
+    mock_event = ESCAPE_EVT
 
     await handlers.on_keyboard_event(mock_event)
     assert state.active_dialog is None
@@ -2091,10 +2039,7 @@ async def test_keyboard_cmd_slash_opens_help(mock_handlers):
     """Test Cmd+/ opens the Help dialog."""
     handlers, page, controls, state = mock_handlers
 
-    mock_event = Mock()
-    mock_event.key = "/"
-    mock_event.ctrl = False
-    mock_event.meta = True
+    mock_event = CMD_SLASH_EVT
 
     with patch.object(handlers, "on_help_click") as mock_help:
         await handlers.on_keyboard_event(mock_event)
@@ -2106,10 +2051,7 @@ async def test_keyboard_ctrl_slash_opens_help(mock_handlers):
     """Test Ctrl+/ opens the Help dialog."""
     handlers, page, controls, state = mock_handlers
 
-    mock_event = Mock()
-    mock_event.key = "/"
-    mock_event.ctrl = True
-    mock_event.meta = False
+    mock_event = CTRL_SLASH_EVT
 
     with patch.object(handlers, "on_help_click") as mock_help:
         await handlers.on_keyboard_event(mock_event)
@@ -2190,7 +2132,7 @@ async def test_clear_packages_confirm_clears_all(mock_handlers):
     await handlers.on_clear_packages(Mock())
 
     # Find the confirm dialog and call the confirm callback
-    dialog = page.opened_controls[-1]
+    dialog = page.last_opened
     # The confirm button is the first action
     confirm_button = dialog.actions[0]
     confirm_button.on_click(Mock())
@@ -1,13 +1,15 @@
 """Test suite for uv_handler.py"""
 
+import platform
+import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+from uv_forger.handlers import uv_handler
 from uv_forger.handlers.uv_handler import (
+    _build_pyproject_appendix,
     _resolve_entry_point,
     configure_pyproject,
     get_uv_path,
@@ -15,306 +17,265 @@ from uv_forger.handlers.uv_handler import (
     setup_virtual_env,
 )
 
+_UV_AVAILABLE = shutil.which("uv") is not None
+
+# Result returned by patched subprocess.run; the uv helpers never inspect it.
+_COMPLETED = subprocess.CompletedProcess(args=[], returncode=0)
+
 
 @pytest.fixture
-def check_uv_available():
-    """Check if uv is available in the system"""
-    try:
-        subprocess.run(
-            ["uv", "--version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+def project_path(tmp_path):
+    """Return a project directory containing an empty pyproject.toml."""
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def recorded_runs(monkeypatch):
+    """Patch uv lookup and subprocess.run; return the list of (cmd, kwargs) calls."""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        return _COMPLETED
+
+    monkeypatch.setattr(uv_handler, "get_uv_path", lambda: "/usr/bin/uv")
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
 
 
 class TestGetUvPath:
     """Tests for get_uv_path function"""
 
+    @pytest.mark.skipif(not _UV_AVAILABLE, reason="uv not installed")
     def test_find_uv_in_path(self):
         """Test find uv in PATH"""
-        try:
-            uv_path = get_uv_path()
-            assert uv_path is not None
-            assert Path(uv_path).exists()
-        except FileNotFoundError:
-            # This is expected if uv is not installed
-            pytest.skip("UV not found (expected if not installed)")
-
-    def test_raises_error_when_not_found(self):
+        uv_path = get_uv_path()
+        assert uv_path is not None
+        assert Path(uv_path).exists()
+
+    def test_raises_error_when_not_found(self, monkeypatch):
         """Test FileNotFoundError when uv not found"""
-        with patch('shutil.which', return_value=None):
-            with patch('pathlib.Path.exists', return_value=False):
-                with pytest.raises(FileNotFoundError) as exc_info:
-                    get_uv_path()
-                assert "Could not find 'uv' executable" in str(exc_info.value)
+        monkeypatch.setattr(shutil, "which", lambda *_: None)
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        with pytest.raises(FileNotFoundError) as exc_info:
+            get_uv_path()
+        assert "Could not find 'uv' executable" in str(exc_info.value)
 
-    def test_windows_path_handling(self):
+    def test_windows_path_handling(self, monkeypatch):
         """Test platform-specific path handling"""
-        with patch('shutil.which', return_value=None):
-            with patch('platform.system', return_value='Windows'):
-                with patch('pathlib.Path.exists', return_value=False):
-                    with pytest.raises(FileNotFoundError):
-                        get_uv_path()
+        monkeypatch.setattr(shutil, "which", lambda *_: None)
+        monkeypatch.setattr(platform, "system", lambda: "Windows")
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+        with pytest.raises(FileNotFoundError):
+            get_uv_path()
 
 
 class TestConfigurePyproject:
     """Tests for configure_pyproject function"""
 
-    def test_append_configuration(self):
+    def test_append_configuration(self, tmp_path):
         """Test append configuration to pyproject.toml"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            pyproject_file = project_path / "pyproject.toml"
+        project_path = tmp_path
+        pyproject_file = project_path / "pyproject.toml"
 
-            # Create initial pyproject.toml
-            initial_content = "[project]\nname = \"test-project\"\n"
-            pyproject_file.write_text(initial_content)
+        # Create initial pyproject.toml
+        initial_content = "[project]\nname = \"test-project\"\n"
+        pyproject_file.write_text(initial_content, encoding="utf-8")
 
-            # Configure it
-            configure_pyproject(project_path, "test_project")
+        # Configure it
+        configure_pyproject(project_path, "test_project")
 
-            # Read the result
-            final_content = pyproject_file.read_text()
+        # Read the result
+        final_content = pyproject_file.read_text(encoding="utf-8")
 
-            # Check if configuration was appended
-            assert initial_content in final_content
-            assert "[tool.hatch.build.targets.wheel]" in final_content
-            assert 'packages = ["app"]' in final_content
-            assert "[project.scripts]" in final_content
-            assert 'test_project = "app.main:main"' in final_content
+        # Check if configuration was appended
+        assert initial_content in final_content
+        assert "[tool.hatch.build.targets.wheel]" in final_content
+        assert 'packages = ["app"]' in final_content
+        assert "[project.scripts]" in final_content
+        assert 'test_project = "app.main:main"' in final_content
 
-    def test_format_of_appended_content(self):
+    def test_format_of_appended_content(self, project_path):
         """Test verify format of appended content"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            pyproject_file = project_path / "pyproject.toml"
-            pyproject_file.write_text("")
+        pyproject_file = project_path / "pyproject.toml"
+
+        configure_pyproject(project_path, "my_app")
+
+        content = pyproject_file.read_text(encoding="utf-8")
+        # Check that it starts with a newline (for separation)
+        assert content.startswith('\n')
+        assert content.endswith(_build_pyproject_appendix("my_app", None, None))
 
-            configure_pyproject(project_path, "my_app")
+    def test_existing_content_is_left_byte_for_byte(self, tmp_path):
+        """Without metadata, the file is only appended to, never rewritten"""
+        pyproject_file = tmp_path / "pyproject.toml"
+        initial_content = "[project]\r\nname = \"keep-crlf\"\r\n"
+        pyproject_file.write_bytes(initial_content.encode())
 
-            content = pyproject_file.read_text()
-            # Check that it starts with a newline (for separation)
-            assert content.startswith('\n')
+        configure_pyproject(tmp_path, "keep-crlf")
 
-    def test_different_project_names(self):
+        assert pyproject_file.read_bytes().startswith(initial_content.encode())
+
+    def test_different_project_names(self, project_path):
         """Test different project names"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            pyproject_file = project_path / "pyproject.toml"
-            pyproject_file.write_text("")
+        pyproject_file = project_path / "pyproject.toml"
 
-            configure_pyproject(project_path, "my-cool-app")
+        configure_pyproject(project_path, "my-cool-app")
 
-            content = pyproject_file.read_text()
-            assert 'my-cool-app = "app.main:main"' in content
+        content = pyproject_file.read_text(encoding="utf-8")
+        assert 'my-cool-app = "app.main:main"' in content
 
 
 class TestUvCommandsWithMocks:
     """Tests for uv command functions with mocks"""
 
-    def test_run_uv_init_command_structure(self):
+    def test_run_uv_init_command_structure(self, tmp_path, recorded_runs):
         """Test run_uv_init command structure"""
-        with patch('uv_forger.handlers.uv_handler.get_uv_path', return_value='/usr/bin/uv'):
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
-
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    project_path = Path(tmpdir)
-                    run_uv_init(project_path, "3.14")
+        project_path = tmp_path
+        run_uv_init(project_path, "3.14")
 
-                    # Verify subprocess.run was called with correct arguments
-                    call_args = mock_run.call_args
-                    cmd = call_args[0][0]
+        # Verify subprocess.run was called with correct arguments
+        cmd, kwargs = recorded_runs[0]
 
-                    assert cmd == ['/usr/bin/uv', 'init', '--python', '3.14', '.']
-                    assert call_args[1]['cwd'] == project_path
-                    assert call_args[1]['check'] == True
+        assert cmd == ['/usr/bin/uv', 'init', '--python', '3.14', '.']
+        assert kwargs['cwd'] == project_path
+        assert kwargs['check'] is True
 
-    def test_setup_virtual_env_command_structure(self):
+    def test_setup_virtual_env_command_structure(self, tmp_path, recorded_runs):
         """Test setup_virtual_env command structure"""
-        with patch('uv_forger.handlers.uv_handler.get_uv_path', return_value='/usr/bin/uv'):
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        project_path = tmp_path
+        setup_virtual_env(project_path, "3.14")
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    project_path = Path(tmpdir)
-                    setup_virtual_env(project_path, "3.14")
+        # Should be called twice: venv and sync
+        assert len(recorded_runs) == 2
 
-                    # Should be called twice: venv and sync
-                    assert mock_run.call_count == 2
+        # Check first call (venv)
+        first_call = recorded_runs[0][0]
+        # Check second call (sync)
+        second_call = recorded_runs[1][0]
 
-                    # Check first call (venv)
-                    first_call = mock_run.call_args_list[0][0][0]
-                    # Check second call (sync)
-                    second_call = mock_run.call_args_list[1][0][0]
+        assert first_call == ['/usr/bin/uv', 'venv', '--python', '3.14']
+        assert second_call == ['/usr/bin/uv', 'sync']
 
-                    assert first_call == ['/usr/bin/uv', 'venv', '--python', '3.14']
-                    assert second_call == ['/usr/bin/uv', 'sync']
 
 class TestResolveEntryPoint:
     """Tests for _resolve_entry_point helper"""
 
-    def test_default_no_framework_no_project_type(self):
-        """Default entry point when nothing is selected"""
-        assert _resolve_entry_point() == "app.main:main"
-
-    def test_flet_framework(self):
-        """Flet framework uses app.main:run"""
-        assert _resolve_entry_point(framework="flet") == "app.main:run"
-
-    def test_gui_frameworks_use_run(self):
-        """All GUI frameworks use app.main:run"""
-        for fw in ["PyQt6", "PySide6", "tkinter (built-in)", "customtkinter",
-                    "kivy", "pygame", "nicegui"]:
-            assert _resolve_entry_point(framework=fw) == "app.main:run", f"{fw} failed"
-
-    def test_streamlit_no_entry_point(self):
-        """Streamlit has its own runner — no entry point"""
-        assert _resolve_entry_point(framework="streamlit") is None
-
-    def test_gradio_no_entry_point(self):
-        """Gradio has its own runner — no entry point"""
-        assert _resolve_entry_point(framework="gradio") is None
-
-    def test_django_no_entry_point(self):
-        """Django has its own runner — no entry point"""
-        assert _resolve_entry_point(project_type="django") is None
-
-    def test_fastapi_no_entry_point(self):
-        """FastAPI has its own runner — no entry point"""
-        assert _resolve_entry_point(project_type="fastapi") is None
-
-    def test_flask_no_entry_point(self):
-        """Flask has its own runner — no entry point"""
-        assert _resolve_entry_point(project_type="flask") is None
-
-    def test_cli_click_entry_point(self):
-        """Click CLI uses app.main:cli"""
-        assert _resolve_entry_point(project_type="cli_click") == "app.main:cli"
-
-    def test_cli_typer_entry_point(self):
-        """Typer CLI uses app.main:app"""
-        assert _resolve_entry_point(project_type="cli_typer") == "app.main:app"
-
-    def test_cli_rich_entry_point(self):
-        """Rich CLI uses app.main:main"""
-        assert _resolve_entry_point(project_type="cli_rich") == "app.main:main"
-
-    def test_framework_takes_priority_over_project_type(self):
-        """Framework entry point takes priority over project type"""
-        result = _resolve_entry_point(framework="flet", project_type="cli_click")
-        assert result == "app.main:run"
-
-    def test_unknown_framework_uses_default(self):
-        """Unknown framework falls back to default"""
-        assert _resolve_entry_point(framework="unknown_fw") == "app.main:main"
-
-    def test_unknown_project_type_uses_default(self):
-        """Unknown project type falls back to default"""
-        assert _resolve_entry_point(project_type="unknown_pt") == "app.main:main"
+    @pytest.mark.parametrize("framework,project_type,expected", [
+        # Default when nothing is selected
+        (None, None, "app.main:main"),
+        # GUI frameworks use app.main:run
+        ("flet", None, "app.main:run"),
+        ("PyQt6", None, "app.main:run"),
+        ("PySide6", None, "app.main:run"),
+        ("tkinter (built-in)", None, "app.main:run"),
+        ("customtkinter", None, "app.main:run"),
+        ("kivy", None, "app.main:run"),
+        ("pygame", None, "app.main:run"),
+        ("nicegui", None, "app.main:run"),
+        # Frameworks and project types with their own runner — no entry point
+        ("streamlit", None, None),
+        ("gradio", None, None),
+        (None, "django", None),
+        (None, "fastapi", None),
+        (None, "flask", None),
+        # CLI project types
+        (None, "cli_click", "app.main:cli"),
+        (None, "cli_typer", "app.main:app"),
+        (None, "cli_rich", "app.main:main"),
+        # Framework takes priority over project type
+        ("flet", "cli_click", "app.main:run"),
+        # Unknown values fall back to the default
+        ("unknown_fw", None, "app.main:main"),
+        (None, "unknown_pt", "app.main:main"),
+    ])
+    def test_resolve_entry_point(self, framework, project_type, expected):
+        """Entry point resolves by framework, then project type, then default"""
+        result = _resolve_entry_point(framework=framework, project_type=project_type)
+        assert result == expected
 
 
 class TestConfigurePyprojectWithContext:
     """Tests for configure_pyproject with framework/project_type context"""
 
-    def test_flet_project_has_run_entry_point(self):
+    def test_flet_project_has_run_entry_point(self, project_path):
         """Flet project should have app.main:run"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
+        configure_pyproject(project_path, "myapp", framework="flet")
 
-            configure_pyproject(project_path, "myapp", framework="flet")
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert '[project.scripts]' in content
+        assert 'myapp = "app.main:run"' in content
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert '[project.scripts]' in content
-            assert 'myapp = "app.main:run"' in content
-
-    def test_django_project_has_no_scripts(self):
+    def test_django_project_has_no_scripts(self, project_path):
         """Django project should NOT have [project.scripts]"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
-
-            configure_pyproject(project_path, "myapp", project_type="django")
+        configure_pyproject(project_path, "myapp", project_type="django")
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert '[tool.hatch.build.targets.wheel]' in content
-            assert '[project.scripts]' not in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert '[tool.hatch.build.targets.wheel]' in content
+        assert '[project.scripts]' not in content
 
-    def test_streamlit_project_has_no_scripts(self):
+    def test_streamlit_project_has_no_scripts(self, project_path):
         """Streamlit project should NOT have [project.scripts]"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
+        configure_pyproject(project_path, "myapp", framework="streamlit")
 
-            configure_pyproject(project_path, "myapp", framework="streamlit")
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert '[tool.hatch.build.targets.wheel]' in content
+        assert '[project.scripts]' not in content
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert '[tool.hatch.build.targets.wheel]' in content
-            assert '[project.scripts]' not in content
-
-    def test_cli_click_entry_point(self):
+    def test_cli_click_entry_point(self, project_path):
         """Click CLI project should have app.main:cli"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
-
-            configure_pyproject(project_path, "myapp", project_type="cli_click")
+        configure_pyproject(project_path, "myapp", project_type="cli_click")
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'myapp = "app.main:cli"' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'myapp = "app.main:cli"' in content
 
-    def test_cli_typer_entry_point(self):
+    def test_cli_typer_entry_point(self, project_path):
         """Typer CLI project should have app.main:app"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
+        configure_pyproject(project_path, "myapp", project_type="cli_typer")
 
-            configure_pyproject(project_path, "myapp", project_type="cli_typer")
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'myapp = "app.main:app"' in content
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'myapp = "app.main:app"' in content
-
-    def test_hatch_section_always_written(self):
+    def test_hatch_section_always_written(self, project_path):
         """Hatch build config should always be present"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
-
-            configure_pyproject(project_path, "myapp", project_type="django")
+        configure_pyproject(project_path, "myapp", project_type="django")
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert '[tool.hatch.build.targets.wheel]' in content
-            assert 'packages = ["app"]' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert '[tool.hatch.build.targets.wheel]' in content
+        assert 'packages = ["app"]' in content
 
-    def test_default_bare_project(self):
+    def test_default_bare_project(self, project_path):
         """Bare project with no framework/type should use app.main:main"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
-
-            configure_pyproject(project_path, "myapp")
+        configure_pyproject(project_path, "myapp")
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'myapp = "app.main:main"' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'myapp = "app.main:main"' in content
 
-    def test_framework_priority_over_project_type(self):
+    def test_framework_priority_over_project_type(self, project_path):
         """Framework entry point takes priority over project type"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text("")
+        configure_pyproject(
+            project_path, "myapp",
+            framework="flet", project_type="cli_click",
+        )
+
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'myapp = "app.main:run"' in content
+
 
-            configure_pyproject(
-                project_path, "myapp",
-                framework="flet", project_type="cli_click",
-            )
+class TestBuildPyprojectAppendix:
+    """Tests for _build_pyproject_appendix helper"""
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'myapp = "app.main:run"' in content
+    def test_includes_scripts_section(self):
+        """Entry point projects get a [project.scripts] section"""
+        block = _build_pyproject_appendix("myapp", "flet", None)
+        assert block.startswith("\n[tool.hatch.build.targets.wheel]")
+        assert 'myapp = "app.main:run"' in block
+
+    def test_omits_scripts_section_without_entry_point(self):
+        """Projects with their own runner get only the hatch section"""
+        block = _build_pyproject_appendix("myapp", None, "django")
+        assert "[project.scripts]" not in block
 
 
 class TestConfigurePyprojectMetadata:
@@ -333,94 +294,98 @@ class TestConfigurePyprojectMetadata:
             'dependencies = []\n'
         )
 
-    def test_author_name_only(self):
+    def test_author_name_only(self, tmp_path):
         """Author name without email produces correct authors line."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text(self._uv_pyproject())
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text(
+            self._uv_pyproject(), encoding="utf-8"
+        )
 
-            configure_pyproject(
-                project_path, "myapp", author_name="Tim"
-            )
+        configure_pyproject(
+            project_path, "myapp", author_name="Tim"
+        )
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'authors = [{name = "Tim"}]' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'authors = [{name = "Tim"}]' in content
 
-    def test_author_name_and_email(self):
+    def test_author_name_and_email(self, tmp_path):
         """Author name and email both appear in authors line."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text(self._uv_pyproject())
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text(
+            self._uv_pyproject(), encoding="utf-8"
+        )
 
-            configure_pyproject(
-                project_path, "myapp",
-                author_name="Tim", author_email="tim@example.com",
-            )
+        configure_pyproject(
+            project_path, "myapp",
+            author_name="Tim", author_email="tim@example.com",
+        )
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'name = "Tim"' in content
-            assert 'email = "tim@example.com"' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'name = "Tim"' in content
+        assert 'email = "tim@example.com"' in content
 
-    def test_description_replaces_empty(self):
+    def test_description_replaces_empty(self, tmp_path):
         """Description replaces the empty UV default."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text(self._uv_pyproject())
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text(
+            self._uv_pyproject(), encoding="utf-8"
+        )
 
-            configure_pyproject(
-                project_path, "myapp", description="A cool project"
-            )
+        configure_pyproject(
+            project_path, "myapp", description="A cool project"
+        )
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'description = "A cool project"' in content
-            assert 'description = ""' not in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'description = "A cool project"' in content
+        assert 'description = ""' not in content
 
-    def test_license_added(self):
+    def test_license_added(self, tmp_path):
         """License SPDX identifier is added."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text(self._uv_pyproject())
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text(
+            self._uv_pyproject(), encoding="utf-8"
+        )
 
-            configure_pyproject(
-                project_path, "myapp", license_type="MIT"
-            )
+        configure_pyproject(
+            project_path, "myapp", license_type="MIT"
+        )
 
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'license = "MIT"' in content
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'license = "MIT"' in content
 
-    def test_all_metadata_fields(self):
+    def test_all_metadata_fields(self, tmp_path):
         """All metadata fields together produce correct output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            (project_path / "pyproject.toml").write_text(self._uv_pyproject())
-
-            configure_pyproject(
-                project_path, "myapp",
-                author_name="Tim",
-                author_email="tim@example.com",
-                description="My project",
-                license_type="Apache-2.0",
-            )
-
-            content = (project_path / "pyproject.toml").read_text()
-            assert 'description = "My project"' in content
-            assert 'name = "Tim"' in content
-            assert 'email = "tim@example.com"' in content
-            assert 'license = "Apache-2.0"' in content
-            # Hatch config still appended
-            assert '[tool.hatch.build.targets.wheel]' in content
-
-    def test_no_metadata_leaves_file_unchanged(self):
+        project_path = tmp_path
+        (project_path / "pyproject.toml").write_text(
+            self._uv_pyproject(), encoding="utf-8"
+        )
+
+        configure_pyproject(
+            project_path, "myapp",
+            author_name="Tim",
+            author_email="tim@example.com",
+            description="My project",
+            license_type="Apache-2.0",
+        )
+
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'description = "My project"' in content
+        assert 'name = "Tim"' in content
+        assert 'email = "tim@example.com"' in content
+        assert 'license = "Apache-2.0"' in content
+        # Hatch config still appended
+        assert '[tool.hatch.build.targets.wheel]' in content
+
+    def test_no_metadata_leaves_file_unchanged(self, tmp_path):
         """No metadata fields leaves the [project] section unchanged."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            original = self._uv_pyproject()
-            (project_path / "pyproject.toml").write_text(original)
-
-            configure_pyproject(project_path, "myapp")
-
-            content = (project_path / "pyproject.toml").read_text()
-            # Original content preserved at the start
-            assert 'description = ""' in content
-            assert "authors" not in content
-            assert 'license = ' not in content
+        project_path = tmp_path
+        original = self._uv_pyproject()
+        (project_path / "pyproject.toml").write_text(original, encoding="utf-8")
+
+        configure_pyproject(project_path, "myapp")
+
+        content = (project_path / "pyproject.toml").read_text(encoding="utf-8")
+        # Original content preserved at the start
+        assert 'description = ""' in content
+        assert "authors" not in content
+        assert 'license = ' not in content
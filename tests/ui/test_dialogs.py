@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Pytest tests for dialogs.py - Project type dialog and about dialog creation"""
 
+import dataclasses
+import re
+from types import SimpleNamespace
+from typing import NamedTuple
 from unittest.mock import AsyncMock, Mock
 
 import flet as ft
@@ -8,6 +12,7 @@ import pytest
 
 from uv_forger.core.models import BuildSummaryConfig
 from uv_forger.core.state import AppState
+from uv_forger.core.template_merger import normalize_folder
 from uv_forger.ui.content_dialogs import create_about_dialog
 from uv_forger.ui.dialogs import (
     _parse_log_line,
@@ -20,18 +25,108 @@ from uv_forger.ui.dialogs import (
 )
 from uv_forger.ui.tree_builder import build_project_tree_lines
 
+pytestmark = [pytest.mark.ui, pytest.mark.xdist_group("dialogs")]
 
-def test_create_project_type_dialog_basic():
-    """Test basic dialog creation"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
+
+def _noop(*args):
+    """Callback for dialogs whose callbacks the test never fires."""
+    return None
+
+
+def _body(dialog):
+    """Control wrapped by the dialog's content Container."""
+    return dialog.content.content
+
+
+def _radio_group(dialog):
+    """RadioGroup of a project type dialog."""
+    return _body(dialog)
+
+
+def _column(dialog):
+    """Column holding the categories and radios of a project type dialog."""
+    return _radio_group(dialog).content
+
+
+PROJECT_TYPE_SELECTIONS = (
+    "django",
+    "fastapi",
+    "flask",
+    "bottle",
+    "data_analysis",
+    "ml_sklearn",
+    "cli_click",
+    "cli_typer",
+    "scraping",
+)
+
+
+EXPECTED_CATEGORIES = frozenset({"Web Frameworks", "CLI Tools"})
+EXPECTED_PROJECT_TYPES = frozenset(
+    {"django", "fastapi", "flask", "data_analysis", "cli_typer", "scraping"}
+)
+
+
+def _project_type_dialog(
+    current_selection: str | None, is_dark_mode: bool
+) -> ft.AlertDialog:
+    """Build a project type dialog with no-op callbacks."""
+    return create_project_type_dialog(
+        on_select_callback=_noop,
+        on_close_callback=_noop,
+        current_selection=current_selection,
+        is_dark_mode=is_dark_mode,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_project_type_dialog():
+    """Project type dialog in dark mode with no current selection."""
+    return _project_type_dialog(None, True)
+
+
+@pytest.fixture(scope="session")
+def light_project_type_dialog():
+    """Project type dialog in light mode with no current selection."""
+    return _project_type_dialog(None, False)
+
+
+def _iter_text(node):
+    """Yield the visible text (Text values, control labels) under a control."""
+    value = getattr(node, "value", None)
+    # A Radio's value is its project type key, not something the user sees
+    if isinstance(value, str) and not isinstance(node, ft.Radio):
+        yield value
+    label = getattr(node, "label", None)
+    if isinstance(label, str):
+        yield label
+    inner = getattr(node, "content", None)
+    if inner is not None:
+        yield from _iter_text(inner)
+    for child in getattr(node, "controls", None) or ():
+        yield from _iter_text(child)
+
+
+@pytest.fixture(scope="session")
+def project_type_dialog_labels(default_project_type_dialog):
+    """Visible texts (a set) and radio values of the default dialog."""
+    column = _column(default_project_type_dialog)
+    radio_values = [
+        control.content.value
+        for control in column.controls
+        if isinstance(control, ft.Container) and isinstance(control.content, ft.Radio)
+    ]
+    return SimpleNamespace(
+        text_values=set(_iter_text(column)), radio_values=radio_values
     )
 
+
+def test_create_project_type_dialog_basic(default_project_type_dialog):
+    """Test basic dialog creation"""
+    dialog = default_project_type_dialog
+
     assert isinstance(dialog, ft.AlertDialog)
-    assert dialog.modal == True
+    assert dialog.modal is True
     assert dialog.title is not None
     assert dialog.content is not None
     assert dialog.actions is not None
@@ -40,141 +135,52 @@ def test_create_project_type_dialog_basic():
 
 def test_create_project_type_dialog_with_selection():
     """Test dialog creation with current selection"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection="django",
-        is_dark_mode=True,
-    )
+    dialog = _project_type_dialog("django", True)
 
     # Find the RadioGroup in the dialog content
-    radio_group = dialog.content.content
+    radio_group = _radio_group(dialog)
     assert isinstance(radio_group, ft.RadioGroup)
     assert radio_group.value == "django"
 
 
-def test_create_project_type_dialog_default_selection():
+def test_create_project_type_dialog_default_selection(default_project_type_dialog):
     """Test dialog defaults to '_none_' when no selection"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
+    assert _radio_group(default_project_type_dialog).value == "_none_"
 
-    radio_group = dialog.content.content
-    assert radio_group.value == "_none_"
 
-
-def test_create_project_type_dialog_dark_mode():
+def test_create_project_type_dialog_dark_mode(default_project_type_dialog):
     """Test dialog creation in dark mode"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
-
-    assert isinstance(dialog, ft.AlertDialog)
+    assert isinstance(default_project_type_dialog, ft.AlertDialog)
     # Dialog should be created without errors in dark mode
 
 
-def test_create_project_type_dialog_light_mode():
+def test_create_project_type_dialog_light_mode(light_project_type_dialog):
     """Test dialog creation in light mode"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=False,
-    )
-
-    assert isinstance(dialog, ft.AlertDialog)
+    assert isinstance(light_project_type_dialog, ft.AlertDialog)
     # Dialog should be created without errors in light mode
 
 
-def test_create_project_type_dialog_has_categories():
+def test_create_project_type_dialog_has_categories(project_type_dialog_labels):
     """Test dialog contains expected project type categories"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
-
-    # Get the radio group content (Column with all controls)
-    radio_group = dialog.content.content
-    column = radio_group.content
-
-    # Extract all text values from the column
-    text_values = []
-    for control in column.controls:
-        if isinstance(control, ft.Container):
-            if isinstance(control.content, ft.Text):
-                text_values.append(control.content.value)
-            elif isinstance(control.content, ft.Row):
-                # Enhanced categories have Row with icon + text
-                for item in control.content.controls:
-                    if isinstance(item, ft.Text):
-                        text_values.append(item.value)
-            elif isinstance(control.content, ft.Radio):
-                text_values.append(control.content.label)
+    text_values = project_type_dialog_labels.text_values
 
     # Check that expected categories appear
-    text_str = " ".join(text_values)
-    assert "Web Frameworks" in text_str
-    assert "Data Science" in text_str or "Data Science & ML" in text_str
-    assert "CLI Tools" in text_str
+    assert text_values >= EXPECTED_CATEGORIES
+    assert "Data Science" in text_values or "Data Science & ML" in text_values
 
 
-def test_create_project_type_dialog_has_project_types():
+def test_create_project_type_dialog_has_project_types(project_type_dialog_labels):
     """Test dialog contains specific project types"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
+    assert set(project_type_dialog_labels.radio_values) >= EXPECTED_PROJECT_TYPES
 
-    radio_group = dialog.content.content
-    column = radio_group.content
 
-    # Extract all radio button values
-    radio_values = []
-    for control in column.controls:
-        if isinstance(control, ft.Container) and isinstance(control.content, ft.Radio):
-                radio_values.append(control.content.value)
-
-    # Check for expected project types
-    assert "django" in radio_values
-    assert "fastapi" in radio_values
-    assert "flask" in radio_values
-    assert "data_analysis" in radio_values
-    assert "cli_typer" in radio_values
-    assert "scraping" in radio_values
-
-
-@pytest.mark.parametrize("project_type", [
-    "django",
-    "fastapi",
-    "flask",
-    "bottle",
-    "data_analysis",
-    "ml_sklearn",
-    "cli_click",
-    "cli_typer",
-    "scraping",
-])
-def test_create_project_type_dialog_various_selections(project_type):
+def test_create_project_type_dialog_various_selections():
     """Test dialog can be created with various project type selections"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=project_type,
-        is_dark_mode=True,
-    )
+    for project_type in PROJECT_TYPE_SELECTIONS:
+        dialog = _project_type_dialog(project_type, True)
 
-    radio_group = dialog.content.content
-    assert radio_group.value == project_type
+        radio_group = _radio_group(dialog)
+        assert radio_group.value == project_type, project_type
 
 
 def test_create_project_type_dialog_callbacks_not_none():
@@ -200,58 +206,55 @@ def test_create_project_type_dialog_callbacks_not_none():
     # Note: We can't easily test callback execution without a full Flet page
 
 
-def test_create_project_type_dialog_content_structure():
+def test_create_project_type_dialog_content_structure(default_project_type_dialog):
     """Test dialog content has correct structure"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
+    dialog = default_project_type_dialog
 
-    # Dialog should have a Container as content
+    # Dialog should have a Container as content, holding a RadioGroup
     assert isinstance(dialog.content, ft.Container)
+    assert isinstance(_radio_group(dialog), ft.RadioGroup)
 
-    # Container should hold a RadioGroup
-    assert isinstance(dialog.content.content, ft.RadioGroup)
-
-    # RadioGroup should have a Column as content
-    radio_group = dialog.content.content
-    assert isinstance(radio_group.content, ft.Column)
+    # RadioGroup should have a Column as content, with controls
+    # (categories and radios)
+    assert isinstance(_column(dialog), ft.Column)
+    assert len(_column(dialog).controls) > 0
 
-    # Column should have controls (categories and radios)
-    column = radio_group.content
-    assert len(column.controls) > 0
 
-
-def test_create_project_type_dialog_actions():
+def test_create_project_type_dialog_actions(default_project_type_dialog):
     """Test dialog has correct action buttons"""
-    dialog = create_project_type_dialog(
-        on_select_callback=lambda x: None,
-        on_close_callback=lambda x: None,
-        current_selection=None,
-        is_dark_mode=True,
-    )
+    actions = default_project_type_dialog.actions
 
-    assert len(dialog.actions) == 2
+    assert len(actions) == 2
 
     # Check button types - Select is FilledButton, Cancel is OutlinedButton
-    assert isinstance(dialog.actions[0], ft.FilledButton)  # Select button
-    assert isinstance(dialog.actions[1], ft.OutlinedButton)  # Cancel button
+    assert isinstance(actions[0], ft.FilledButton)  # Select button
+    assert isinstance(actions[1], ft.OutlinedButton)  # Cancel button
 
 
 # ========== About Dialog Tests ==========
 
 
+async def _noop_async(*args, **kwargs):
+    pass
+
+
+class _StubPage:
+    """Minimal page for the about dialog, which only uses launch_url."""
+    __slots__ = ()
+
+    launch_url = staticmethod(_noop_async)
+
+
+# Stateless, so every about dialog test can share it.
+_STUB_PAGE = _StubPage()
+
+
 def test_create_about_dialog_basic():
     """Test about dialog creates a valid AlertDialog."""
-    page = Mock()
-    page.launch_url = AsyncMock()
-
     dialog = create_about_dialog(
         content="# About\nTest content",
-        on_close=lambda _: None,
-        page=page,
+        on_close=_noop,
+        page=_STUB_PAGE,
         is_dark_mode=True,
     )
 
@@ -263,13 +266,10 @@ def test_create_about_dialog_basic():
 
 def test_create_about_dialog_light_mode():
     """Test about dialog works in light mode."""
-    page = Mock()
-    page.launch_url = AsyncMock()
-
     dialog = create_about_dialog(
         content="# About",
-        on_close=lambda _: None,
-        page=page,
+        on_close=_noop,
+        page=_STUB_PAGE,
         is_dark_mode=False,
     )
 
@@ -278,14 +278,12 @@ def test_create_about_dialog_light_mode():
 
 def test_create_about_dialog_with_internal_link_callback():
     """Test about dialog accepts on_internal_link parameter."""
-    page = Mock()
-    page.launch_url = AsyncMock()
     captured = []
 
     dialog = create_about_dialog(
         content="# About\n[Help](app://help)",
-        on_close=lambda _: None,
-        page=page,
+        on_close=_noop,
+        page=_STUB_PAGE,
         is_dark_mode=True,
         on_internal_link=lambda path: captured.append(path),
     )
@@ -295,18 +293,15 @@ def test_create_about_dialog_with_internal_link_callback():
 
 def test_create_about_dialog_has_markdown_content():
     """Test about dialog wraps content in a Markdown widget."""
-    page = Mock()
-    page.launch_url = AsyncMock()
-
     dialog = create_about_dialog(
         content="# UV Project Creator\nVersion 0.1.0",
-        on_close=lambda _: None,
-        page=page,
+        on_close=_noop,
+        page=_STUB_PAGE,
         is_dark_mode=True,
     )
 
     # Content is Container > Column > [Markdown]
-    column = dialog.content.content
+    column = _body(dialog)
     assert isinstance(column, ft.Column)
     assert len(column.controls) == 1
     assert isinstance(column.controls[0], ft.Markdown)
@@ -315,214 +310,238 @@ def test_create_about_dialog_has_markdown_content():
 # ========== Project Tree Preview Tests ==========
 
 
+_CONFIG_DEFAULTS = dict(
+    project_name="my_project",
+    project_path="/tmp",
+    python_version="3.14",
+    git_enabled=True,
+    ui_project_enabled=False,
+    framework=None,
+    other_project_enabled=False,
+    project_type=None,
+    starter_files=True,
+    folder_count=2,
+    file_count=5,
+    packages=[],
+    folders=[
+        {
+            "name": "core",
+            "create_init": True,
+            "subfolders": [],
+            "files": ["state.py", "models.py"],
+        },
+        {
+            "name": "ui",
+            "create_init": True,
+            "subfolders": [],
+            "files": ["components.py"],
+        },
+    ],
+)
+
+# Folder shapes used by the tree tests. Shared, so never mutate them.
+# (These stay plain dicts: tree_builder checks isinstance(folder, dict),
+# which a MappingProxyType would fail.)
+_FOLDER_CORE_EMPTY = {
+    "name": "core",
+    "create_init": True,
+    "subfolders": [],
+    "files": [],
+}
+_FOLDER_ASSETS_NO_INIT = {
+    "name": "assets",
+    "create_init": False,
+    "subfolders": [],
+    "files": ["logo.png"],
+}
+_FOLDER_TESTS_ROOT = {
+    "name": "tests",
+    "root_level": True,
+    "create_init": True,
+    "subfolders": [],
+    "files": [],
+}
+_FOLDER_CORE_NESTED = {
+    "name": "core",
+    "create_init": True,
+    "subfolders": [
+        {
+            "name": "utils",
+            "create_init": True,
+            "subfolders": [],
+            "files": ["helpers.py"],
+        }
+    ],
+    "files": ["state.py"],
+}
+_RAW_FOLDER_ASSETS_STRING_SUBFOLDERS = {
+    "name": "assets",
+    "create_init": False,
+    "subfolders": ["icons", "images"],
+    "files": [],
+}
+
+# Shared by every test that needs the default config; treat as read-only.
+_DEFAULT_CONFIG = BuildSummaryConfig(**_CONFIG_DEFAULTS)
+
+
 def _make_config(**overrides) -> BuildSummaryConfig:
     """Create a BuildSummaryConfig with sensible defaults."""
-    defaults = dict(
-        project_name="my_project",
-        project_path="/tmp",
-        python_version="3.14",
-        git_enabled=True,
-        ui_project_enabled=False,
-        framework=None,
-        other_project_enabled=False,
-        project_type=None,
-        starter_files=True,
-        folder_count=2,
-        file_count=5,
-        packages=[],
-        folders=[
-            {
-                "name": "core",
-                "create_init": True,
-                "subfolders": [],
-                "files": ["state.py", "models.py"],
-            },
-            {
-                "name": "ui",
-                "create_init": True,
-                "subfolders": [],
-                "files": ["components.py"],
-            },
-        ],
-    )
-    defaults.update(overrides)
-    return BuildSummaryConfig(**defaults)
-
-
-def test_tree_root_line():
-    """Tree starts with project_name/."""
-    config = _make_config()
-    lines = build_project_tree_lines(config)
-    assert lines[0] == "my_project/"
-
-
-def test_tree_includes_root_files_with_git():
-    """Tree includes .gitignore when git is enabled."""
-    config = _make_config(git_enabled=True)
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert ".gitignore" in text
-    assert ".python-version" in text
-    assert "README.md" in text
-    assert "pyproject.toml" in text
-
-
-def test_tree_excludes_gitignore_without_git():
-    """Tree excludes .gitignore when git is disabled."""
-    config = _make_config(git_enabled=False)
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert ".gitignore" not in text
-    assert "pyproject.toml" in text
-
-
-def test_tree_includes_app_dir():
-    """Tree includes app/ with __init__.py and main.py."""
-    config = _make_config()
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert "app/" in text
-    assert "__init__.py" in text
-    assert "main.py" in text
-
-
-def test_tree_includes_template_folders():
-    """Tree includes template folders inside app/."""
-    config = _make_config()
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert "core/" in text
-    assert "state.py" in text
-    assert "models.py" in text
-    assert "ui/" in text
-    assert "components.py" in text
+    if not overrides:
+        return _DEFAULT_CONFIG
+    return dataclasses.replace(_DEFAULT_CONFIG, **overrides)
+
+
+# Characters tree_builder draws in front of an entry name
+_TREE_PREFIX_CHARS = "│├└─ "
+_TREE_PREFIX_RE = re.compile(f"[{_TREE_PREFIX_CHARS}]*")
+
+
+def _indent(line: str) -> int:
+    """Width of the box-drawing prefix in front of a tree line's entry."""
+    return _TREE_PREFIX_RE.match(line).end()
+
+
+class TreeResult(NamedTuple):
+    """Project tree preview shared between the tree tests (read-only)."""
+
+    lines: tuple[str, ...]
+    text: str
+    # Entry names: lines without their box-drawing prefix, e.g. "app/"
+    tokens: frozenset[str]
+
+
+def _build_tree(config: BuildSummaryConfig) -> TreeResult:
+    """Render the tree for config and index its lines."""
+    lines = tuple(build_project_tree_lines(config))
+    return TreeResult(
+        lines=lines,
+        text="\n".join(lines),
+        tokens=frozenset(line.lstrip(_TREE_PREFIX_CHARS) for line in lines),
+    )
+
+
+# Tree for the default config, shared by the tests that use no overrides
+_DEFAULT_TREE = _build_tree(_DEFAULT_CONFIG)
+
+
+def _tree(**overrides) -> TreeResult:
+    """Return the tree for _make_config(**overrides)."""
+    if not overrides:
+        return _DEFAULT_TREE
+    return _build_tree(_make_config(**overrides))
+
+
+def _find_lines(lines, *needles) -> dict[str, int | None]:
+    """Map each needle to the index of the first line containing it.
+
+    Scans ``lines`` once and stops as soon as every needle has been found;
+    needles that never match map to None.
+    """
+    found: dict[str, int | None] = dict.fromkeys(needles)
+    remaining = len(found)
+    for i, line in enumerate(lines):
+        for needle in needles:
+            if found[needle] is None and needle in line:
+                found[needle] = i
+                remaining -= 1
+        if not remaining:
+            break
+    return found
+
+
+# (overrides, entries that must appear, entries that must not appear)
+_TREE_CASES = [
+    pytest.param(
+        {"git_enabled": True},
+        (".gitignore", ".python-version", "README.md", "pyproject.toml"),
+        (),
+        id="root-files-with-git",
+    ),
+    pytest.param(
+        {"git_enabled": False},
+        ("pyproject.toml",),
+        (".gitignore",),
+        id="no-gitignore-without-git",
+    ),
+    pytest.param({}, ("app/", "__init__.py", "main.py"), (), id="app-dir"),
+    pytest.param(
+        {},
+        ("core/", "state.py", "models.py", "ui/", "components.py"),
+        (),
+        id="template-folders",
+    ),
+]
+
+
+@pytest.mark.parametrize("overrides,present,absent", _TREE_CASES)
+def test_tree_entries(overrides, present, absent):
+    """Tree starts with project_name/, uses box drawing and lists the entries."""
+    tree = _tree(**overrides)
+
+    assert tree.lines[0] == "my_project/"
+    assert "├── " in tree.text or "└── " in tree.text
+    for entry in present:
+        assert entry in tree.tokens, entry
+    for entry in absent:
+        assert entry not in tree.tokens, entry
 
 
 def test_tree_create_init_true_shows_init_py():
     """Folders with create_init=True show __init__.py."""
-    config = _make_config(
-        folders=[{"name": "core", "create_init": True, "subfolders": [], "files": []}]
-    )
-    lines = build_project_tree_lines(config)
+    tree = _tree(folders=[_FOLDER_CORE_EMPTY])
     # Find __init__.py under core/
-    core_idx = next(i for i, l in enumerate(lines) if "core/" in l)
-    assert "__init__.py" in lines[core_idx + 1]
+    core_idx = _find_lines(tree.lines, "core/")["core/"]
+    assert "__init__.py" in tree.lines[core_idx + 1]
 
 
 def test_tree_create_init_false_no_init_py():
     """Folders with create_init=False don't show __init__.py."""
-    config = _make_config(
-        folders=[
-            {
-                "name": "assets",
-                "create_init": False,
-                "subfolders": [],
-                "files": ["logo.png"],
-            }
-        ]
-    )
-    lines = build_project_tree_lines(config)
+    tree = _tree(folders=[_FOLDER_ASSETS_NO_INIT])
     # Find the line after assets/
-    assets_idx = next(i for i, l in enumerate(lines) if "assets/" in l)
-    assert "logo.png" in lines[assets_idx + 1]
+    assets_idx = _find_lines(tree.lines, "assets/")["assets/"]
+    assert "logo.png" in tree.lines[assets_idx + 1]
     # No __init__.py between assets/ and logo.png
-    assert "__init__" not in lines[assets_idx + 1]
+    assert "__init__" not in tree.lines[assets_idx + 1]
 
 
 def test_tree_create_init_false_inherited_by_string_subfolders():
     """String subfolders inherit create_init=False from parent — no __init__.py."""
-    from uv_forger.core.template_merger import normalize_folder
-
-    raw_folder = {
-        "name": "assets",
-        "create_init": False,
-        "subfolders": ["icons", "images"],
-        "files": [],
-    }
-    config = _make_config(folders=[normalize_folder(raw_folder)])
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
+    tree = _tree(folders=[normalize_folder(_RAW_FOLDER_ASSETS_STRING_SUBFOLDERS)])
     # icons/ and images/ should appear but not contain __init__.py
-    assert "icons/" in text
-    assert "images/" in text
+    assert "icons/" in tree.tokens
+    assert "images/" in tree.tokens
     # Count __init__.py occurrences — only app/ should have one
-    init_count = text.count("__init__.py")
+    init_count = tree.text.count("__init__.py")
     assert init_count == 1  # Only app/__init__.py
 
 
 def test_tree_root_level_folders():
     """Root-level folders appear at project root, not inside app/."""
-    config = _make_config(
-        folders=[
-            {
-                "name": "tests",
-                "root_level": True,
-                "create_init": True,
-                "subfolders": [],
-                "files": [],
-            },
-            {
-                "name": "core",
-                "create_init": True,
-                "subfolders": [],
-                "files": [],
-            },
-        ]
-    )
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
+    tree = _tree(folders=[_FOLDER_TESTS_ROOT, _FOLDER_CORE_EMPTY])
     # tests/ should be at root level (same indent as app/)
     # Find the app/ line and tests/ line — they should have the same prefix depth
-    app_line = next(l for l in lines if "app/" in l)
-    tests_line = next(l for l in lines if "tests/" in l)
-    app_prefix = len(app_line) - len(app_line.lstrip("│├└── "))
-    tests_prefix = len(tests_line) - len(tests_line.lstrip("│├└── "))
-    assert app_prefix == tests_prefix
+    found = _find_lines(tree.lines, "app/", "tests/")
+    app_line = tree.lines[found["app/"]]
+    tests_line = tree.lines[found["tests/"]]
+    assert _indent(app_line) == _indent(tests_line)
 
 
 def test_tree_nested_subfolders():
     """Tree handles nested subfolders correctly."""
-    config = _make_config(
-        folders=[
-            {
-                "name": "core",
-                "create_init": True,
-                "subfolders": [
-                    {
-                        "name": "utils",
-                        "create_init": True,
-                        "subfolders": [],
-                        "files": ["helpers.py"],
-                    }
-                ],
-                "files": ["state.py"],
-            }
-        ]
-    )
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert "core/" in text
-    assert "utils/" in text
-    assert "helpers.py" in text
-    assert "state.py" in text
+    tree = _tree(folders=[_FOLDER_CORE_NESTED])
+    assert "core/" in tree.tokens
+    assert "utils/" in tree.tokens
+    assert "helpers.py" in tree.tokens
+    assert "state.py" in tree.tokens
 
 
 def test_tree_empty_folders():
     """Tree works with no template folders."""
-    config = _make_config(folders=[])
-    lines = build_project_tree_lines(config)
-    text = "\n".join(lines)
-    assert "my_project/" in text
-    assert "app/" in text
-    assert "main.py" in text
-
-
-def test_tree_box_drawing_characters():
-    """Tree uses Unicode box-drawing characters."""
-    config = _make_config()
-    lines = build_project_tree_lines(config)
-    all_text = "\n".join(lines)
-    assert "├── " in all_text or "└── " in all_text
+    tree = _tree(folders=[])
+    assert "my_project/" in tree.tokens
+    assert "app/" in tree.tokens
+    assert "main.py" in tree.tokens
 
 
 # ========== Log Viewer Dialog Tests ==========
@@ -536,7 +555,7 @@ def test_create_log_viewer_dialog():
     )
     dialog = create_log_viewer_dialog(
         log_content=sample,
-        on_close_callback=lambda _: None,
+        on_close_callback=_noop,
         is_dark_mode=True,
     )
 
@@ -550,55 +569,93 @@ def test_create_log_viewer_dialog_empty():
     """Test log viewer dialog with empty content shows placeholder."""
     dialog = create_log_viewer_dialog(
         log_content="",
-        on_close_callback=lambda _: None,
+        on_close_callback=_noop,
         is_dark_mode=True,
     )
-    column = dialog.content.content
+    column = _body(dialog)
     assert len(column.controls) == 1
     assert isinstance(column.controls[0], ft.Text)
 
 
-def test_parse_log_line_standard():
-    """Test standard log lines are parsed into coloured rows."""
-    line = "2026-02-19 10:00:00 | INFO     | app.main:start:10 - App started"
-    row = _parse_log_line(line, is_dark_mode=True)
-
-    assert isinstance(row, ft.Row)
-    # Should have timestamp, sep, level, sep, location, sep, message = 7 parts
-    assert len(row.controls) == 7
-
-
-def test_parse_log_line_continuation():
-    """Test non-standard lines (tracebacks) render as plain text."""
-    line = "  File \"/app/main.py\", line 10, in start"
-    row = _parse_log_line(line, is_dark_mode=True)
+_INFO_LINE = "2026-02-19 10:00:00 | INFO     | app.main:start:10 - Started"
+
+
+def _on_location_click(module, line_no):
+    pass
+
+
+# (line, is_dark_mode, on_location_click, expected). Expected keys:
+#   controls: number of controls in the row
+#   color: {control index: color}
+#   bold: control indices that use bold weight
+#   location_type: type of the location control (index 4)
+_LOG_CASES = [
+    pytest.param(
+        "2026-02-19 10:00:00 | INFO     | app.main:start:10 - App started",
+        True,
+        None,
+        # timestamp, sep, level, sep, location, sep, message = 7 parts
+        {"controls": 7},
+        id="standard",
+    ),
+    pytest.param(
+        "  File \"/app/main.py\", line 10, in start",
+        True,
+        None,
+        # Non-standard lines (tracebacks) render as a single plain Text
+        {"controls": 1, "color": {0: ft.Colors.GREY_600}},
+        id="continuation",
+    ),
+    pytest.param(
+        "2026-02-19 10:00:00 | CRITICAL | app.main:crash:1 - Fatal error",
+        True,
+        None,
+        # Level text (index 2) and message text (index 6) are bold
+        {"bold": (2, 6)},
+        id="critical-is-bold",
+    ),
+    pytest.param(
+        _INFO_LINE, True, None, {"color": {2: ft.Colors.GREY_400}}, id="info-dark"
+    ),
+    pytest.param(
+        _INFO_LINE, False, None, {"color": {2: ft.Colors.GREY_700}}, id="info-light"
+    ),
+    pytest.param(
+        _INFO_LINE,
+        True,
+        _on_location_click,
+        {"location_type": ft.GestureDetector},
+        id="location-callback",
+    ),
+    pytest.param(
+        _INFO_LINE,
+        True,
+        None,
+        {"location_type": ft.Text},
+        id="location-without-callback",
+    ),
+]
+
+
+@pytest.mark.parametrize("line,is_dark_mode,on_location_click,expected", _LOG_CASES)
+def test_parse_log_line(line, is_dark_mode, on_location_click, expected):
+    """Test log lines are parsed into rows with the expected styling."""
+    row = _parse_log_line(
+        line, is_dark_mode=is_dark_mode, on_location_click=on_location_click
+    )
 
     assert isinstance(row, ft.Row)
-    assert len(row.controls) == 1  # Single plain Text
-    assert row.controls[0].color == ft.Colors.GREY_600
-
-
-def test_parse_log_line_critical_is_bold():
-    """Test CRITICAL lines use bold weight."""
-    line = "2026-02-19 10:00:00 | CRITICAL | app.main:crash:1 - Fatal error"
-    row = _parse_log_line(line, is_dark_mode=True)
-
-    # Find the level text (index 2) and message text (index 6)
-    level_text = row.controls[2]
-    message_text = row.controls[6]
-    assert level_text.weight == ft.FontWeight.BOLD
-    assert message_text.weight == ft.FontWeight.BOLD
-
-
-def test_parse_log_line_light_mode_info_color():
-    """Test INFO uses different color in light mode."""
-    line = "2026-02-19 10:00:00 | INFO     | app.main:start:10 - Started"
-    row_dark = _parse_log_line(line, is_dark_mode=True)
-    row_light = _parse_log_line(line, is_dark_mode=False)
-
-    # Level text color should differ between modes
-    assert row_dark.controls[2].color == ft.Colors.GREY_400
-    assert row_light.controls[2].color == ft.Colors.GREY_700
+    if "controls" in expected:
+        assert len(row.controls) == expected["controls"]
+    for index, color in expected.get("color", {}).items():
+        assert row.controls[index].color == color
+    for index in expected.get("bold", ()):
+        assert row.controls[index].weight == ft.FontWeight.BOLD
+    if "location_type" in expected:
+        loc_control = row.controls[4]
+        assert isinstance(loc_control, expected["location_type"])
+        if expected["location_type"] is ft.GestureDetector:
+            assert loc_control.mouse_cursor == ft.MouseCursor.CLICK
 
 
 def test_parse_log_location_valid():
@@ -614,41 +671,32 @@ def test_parse_log_location_invalid():
     assert _parse_log_location("mod:func:notanum") is None
 
 
-def test_parse_log_line_with_location_callback():
-    """Test location becomes a GestureDetector when callback is provided."""
-    captured = []
-
-    def on_click(module, line_no):
-        captured.append((module, line_no))
-
-    line = "2026-02-19 10:00:00 | INFO     | app.main:start:10 - Started"
-    row = _parse_log_line(line, is_dark_mode=True, on_location_click=on_click)
-
-    # Location control (index 4) should be a GestureDetector
-    loc_control = row.controls[4]
-    assert isinstance(loc_control, ft.GestureDetector)
-    assert loc_control.mouse_cursor == ft.MouseCursor.CLICK
-
+# ========== Add Packages Dialog Tests ==========
 
-def test_parse_log_line_without_callback_is_plain_text():
-    """Test location is plain Text when no callback is provided."""
-    line = "2026-02-19 10:00:00 | INFO     | app.main:start:10 - Started"
-    row = _parse_log_line(line, is_dark_mode=True, on_location_click=None)
 
-    loc_control = row.controls[4]
-    assert isinstance(loc_control, ft.Text)
+@pytest.fixture(scope="session")
+def dark_packages_dialog():
+    """Add packages dialog in dark mode, shared by read-only tests."""
+    return create_add_packages_dialog(
+        on_add_callback=_noop,
+        on_close_callback=_noop,
+        is_dark_mode=True,
+    )
 
 
-# ========== Add Packages Dialog Tests ==========
+@pytest.fixture(scope="session")
+def light_packages_dialog():
+    """Add packages dialog in light mode, shared by read-only tests."""
+    return create_add_packages_dialog(
+        on_add_callback=_noop,
+        on_close_callback=_noop,
+        is_dark_mode=False,
+    )
 
 
-def test_create_add_packages_dialog_basic():
+def test_create_add_packages_dialog_basic(dark_packages_dialog):
     """Test add packages dialog creates a valid AlertDialog."""
-    dialog = create_add_packages_dialog(
-        on_add_callback=lambda pkgs: None,
-        on_close_callback=lambda _: None,
-        is_dark_mode=True,
-    )
+    dialog = dark_packages_dialog
 
     assert isinstance(dialog, ft.AlertDialog)
     assert dialog.modal is True
@@ -656,41 +704,27 @@ def test_create_add_packages_dialog_basic():
     assert len(dialog.actions) == 2  # Add and Cancel
 
 
-def test_create_add_packages_dialog_has_verify_button():
+def test_create_add_packages_dialog_has_verify_button(dark_packages_dialog):
     """Test add packages dialog includes the Verify on PyPI button."""
-    dialog = create_add_packages_dialog(
-        on_add_callback=lambda pkgs: None,
-        on_close_callback=lambda _: None,
-        is_dark_mode=True,
-    )
+    dialog = dark_packages_dialog
 
     assert hasattr(dialog, "verify_button")
     assert isinstance(dialog.verify_button, ft.Button)
     assert "Verify" in dialog.verify_button.content
 
 
-def test_create_add_packages_dialog_has_results_column():
+def test_create_add_packages_dialog_has_results_column(dark_packages_dialog):
     """Test add packages dialog includes a results column (initially hidden)."""
-    dialog = create_add_packages_dialog(
-        on_add_callback=lambda pkgs: None,
-        on_close_callback=lambda _: None,
-        is_dark_mode=True,
-    )
+    dialog = dark_packages_dialog
 
     assert hasattr(dialog, "results_column")
     assert isinstance(dialog.results_column, ft.Column)
     assert dialog.results_column.visible is False
 
 
-def test_create_add_packages_dialog_light_mode():
+def test_create_add_packages_dialog_light_mode(light_packages_dialog):
     """Test add packages dialog works in light mode."""
-    dialog = create_add_packages_dialog(
-        on_add_callback=lambda pkgs: None,
-        on_close_callback=lambda _: None,
-        is_dark_mode=False,
-    )
-
-    assert isinstance(dialog, ft.AlertDialog)
+    assert isinstance(light_packages_dialog, ft.AlertDialog)
 
 
 # ========== Metadata Dialog Tests ==========
@@ -701,8 +735,8 @@ def test_create_metadata_dialog_basic():
     state = AppState()
     dialog = create_metadata_dialog(
         state=state,
-        on_save_callback=lambda *args: None,
-        on_close_callback=lambda _: None,
+        on_save_callback=_noop,
+        on_close_callback=_noop,
         is_dark_mode=True,
     )
 
@@ -716,8 +750,8 @@ def test_create_metadata_dialog_light_mode():
     state = AppState()
     dialog = create_metadata_dialog(
         state=state,
-        on_save_callback=lambda *args: None,
-        on_close_callback=lambda _: None,
+        on_save_callback=_noop,
+        on_close_callback=_noop,
         is_dark_mode=False,
     )
 
@@ -734,8 +768,8 @@ def test_create_metadata_dialog_pre_populated():
 
     dialog = create_metadata_dialog(
         state=state,
-        on_save_callback=lambda *args: None,
-        on_close_callback=lambda _: None,
+        on_save_callback=_noop,
+        on_close_callback=_noop,
         is_dark_mode=True,
     )
 
@@ -749,8 +783,8 @@ def test_create_metadata_dialog_pre_populated():
 def test_create_add_item_dialog_basic():
     """Test add item dialog creates a valid AlertDialog."""
     dialog = create_add_item_dialog(
-        on_add_callback=lambda n, t, p, c: None,
-        on_close_callback=lambda _: None,
+        on_add_callback=_noop,
+        on_close_callback=_noop,
         parent_folders=[],
         is_dark_mode=True,
     )
@@ -767,13 +801,13 @@ def test_create_add_item_dialog_with_parent_folders():
         {"label": "core/utils/", "path": [0, "subfolders", 0]},
     ]
     dialog = create_add_item_dialog(
-        on_add_callback=lambda n, t, p, c: None,
-        on_close_callback=lambda _: None,
+        on_add_callback=_noop,
+        on_close_callback=_noop,
         parent_folders=parents,
         is_dark_mode=True,
     )
     # Content has a Column; find the Dropdown inside
-    column = dialog.content.content
+    column = _body(dialog)
     dropdowns = [c for c in column.controls if isinstance(c, ft.Dropdown)]
     assert len(dropdowns) == 1
     # root + 2 parent folders = 3 options
@@ -783,12 +817,12 @@ def test_create_add_item_dialog_with_parent_folders():
 def test_create_add_item_dialog_browse_hidden_without_callback():
     """Test browse rows are hidden when no callbacks are provided."""
     dialog = create_add_item_dialog(
-        on_add_callback=lambda n, t, p, c: None,
-        on_close_callback=lambda _: None,
+        on_add_callback=_noop,
+        on_close_callback=_noop,
         parent_folders=[],
         is_dark_mode=True,
     )
-    column = dialog.content.content
+    column = _body(dialog)
     rows = [c for c in column.controls if isinstance(c, ft.Row)]
     # Both browse_row and browse_folder_row exist but are not visible
     assert len(rows) == 2
@@ -799,13 +833,13 @@ def test_create_add_item_dialog_browse_hidden_without_callback():
 def test_create_add_item_dialog_browse_row_with_callback():
     """Test browse rows exist when callbacks are provided."""
     dialog = create_add_item_dialog(
-        on_add_callback=lambda n, t, p, c: None,
-        on_close_callback=lambda _: None,
+        on_add_callback=_noop,
+        on_close_callback=_noop,
         parent_folders=[],
         is_dark_mode=True,
         on_browse_callback=AsyncMock(),
     )
-    column = dialog.content.content
+    column = _body(dialog)
     rows = [c for c in column.controls if isinstance(c, ft.Row)]
     # browse_row (file) hidden since type defaults to folder; browse_folder_row hidden (no callback)
     assert len(rows) == 2
@@ -822,12 +856,12 @@ def test_create_add_item_dialog_callback_receives_content_none():
 
     dialog = create_add_item_dialog(
         on_add_callback=capture,
-        on_close_callback=lambda _: None,
+        on_close_callback=_noop,
         parent_folders=[],
         is_dark_mode=True,
     )
     # Simulate: set name, keep type as "folder", click Add
-    column = dialog.content.content
+    column = _body(dialog)
     text_fields = [c for c in column.controls if isinstance(c, ft.TextField)]
     text_fields[0].value = "test_folder"
 
@@ -33,6 +33,30 @@ from uv_forger.ui.dialogs import (
     create_confirm_dialog,
 )
 
+# (control attribute name, property, value) applied by _do_reset. Values that
+# depend on state (path, Python version, git default) are set separately.
+_RESET_CONTROL_VALUES: tuple[tuple[str, str, object], ...] = (
+    ("project_name_input", "value", ""),
+    ("preset_dropdown", "value", "None"),
+    ("include_starter_files_checkbox", "value", True),
+    ("ui_project_checkbox", "value", False),
+    ("ui_project_checkbox", "label", UI_PROJECT_CHECKBOX_LABEL),
+    ("other_projects_checkbox", "value", False),
+    ("other_projects_checkbox", "label", OTHER_PROJECT_CHECKBOX_LABEL),
+    ("create_git_checkbox", "label_style", None),
+    ("ui_project_checkbox", "label_style", None),
+    ("other_projects_checkbox", "label_style", None),
+    ("warning_banner", "value", ""),
+    ("pypi_status_text", "value", ""),
+    ("check_pypi_button", "disabled", True),
+    ("path_preview_text", "value", "\u00a0"),
+    ("progress_ring", "visible", False),
+    ("progress_bar", "visible", False),
+    ("progress_step_text", "visible", False),
+    ("metadata_checkbox", "value", False),
+    ("metadata_checkbox", "label_style", None),
+)
+
 
 class BuildHandlersMixin:
     """Mixin for build execution, reset, exit, and keyboard shortcuts.
@@ -603,38 +627,18 @@ class BuildHandlersMixin:
         self.state.reset()
 
         self.controls.project_path_input.value = self.state.project_path
-        self.controls.project_name_input.value = ""
         self.controls.python_version_dropdown.value = self.state.python_version
-        self.controls.preset_dropdown.value = "None"
         self.controls.create_git_checkbox.value = self.state.git_enabled
-        self.controls.include_starter_files_checkbox.value = True
-        self.controls.ui_project_checkbox.value = False
-        self.controls.ui_project_checkbox.label = UI_PROJECT_CHECKBOX_LABEL
-        self.controls.other_projects_checkbox.value = False
-        self.controls.other_projects_checkbox.label = OTHER_PROJECT_CHECKBOX_LABEL
-        for cb in (
-            self.controls.create_git_checkbox,
-            self.controls.ui_project_checkbox,
-            self.controls.other_projects_checkbox,
-        ):
-            cb.label_style = None
+        for control_name, attr, value in _RESET_CONTROL_VALUES:
+            setattr(getattr(self.controls, control_name), attr, value)
         self._style_selected_checkbox(self.controls.include_starter_files_checkbox)
         self._style_selected_checkbox(self.controls.create_git_checkbox)
-        self.controls.warning_banner.value = ""
-        self.controls.pypi_status_text.value = ""
-        self.controls.check_pypi_button.disabled = True
-        self.controls.path_preview_text.value = "\u00a0"
-        self.controls.progress_ring.visible = False
-        self.controls.progress_bar.visible = False
-        self.controls.progress_step_text.visible = False
         self.page.title = "UV Forger"
 
         self._set_validation_icon(self.controls.project_path_input, True)
         self._set_validation_icon(self.controls.project_name_input, None)
         self._update_build_button_state()
 
-        self.controls.metadata_checkbox.value = False
-        self.controls.metadata_checkbox.label_style = None
         self._reload_and_merge_templates()
         self._update_metadata_summary()
 
@@ -3,10 +3,12 @@
 import asyncio
 import subprocess
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 import flet as ft
 
+from uv_forger.core.async_executor import AsyncExecutor
 from uv_forger.core.constants import (
     ABOUT_FILE,
     APP_CHEAT_SHEET_FILE,
@@ -35,6 +37,24 @@ from uv_forger.ui.theme_manager import get_theme_colors
 _APP_ROOT = Path(__file__).parent.parent.parent
 
 
+@lru_cache(maxsize=8)
+def _read_markdown(path: Path, mtime_ns: int) -> str:
+    """Read a bundled markdown file, cached per (path, modification time)."""
+    return path.read_text(encoding="utf-8")
+
+
+def _load_markdown(path: Path) -> str:
+    """Return the text of a help/about markdown file.
+
+    Repeat opens of the same dialog reuse the cached text; editing the file
+    changes its mtime and invalidates the entry.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+    """
+    return _read_markdown(path, path.stat().st_mtime_ns)
+
+
 class FeatureHandlersMixin:
     """Mixin for UI feature handlers: theme, help, about, settings, log viewer.
 
@@ -61,10 +81,28 @@ class FeatureHandlersMixin:
         self.page.bottom_appbar.bgcolor = colors["bottom_bar"]
         self.page.update()
 
+    async def prewarm_markdown(self) -> None:
+        """Load the Help, App Cheat Sheet, and About files in the background.
+
+        Fills the markdown cache at startup so the first click on any of
+        these dialogs doesn't wait on disk. OSErrors are ignored here; the
+        click handlers report missing files when the dialog is opened.
+        """
+        results = await asyncio.gather(
+            *(
+                AsyncExecutor.run(_load_markdown, path)
+                for path in (HELP_FILE, APP_CHEAT_SHEET_FILE, ABOUT_FILE)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, OSError):
+                raise result
+
     async def on_help_click(self, e: ft.ControlEvent) -> None:
         """Handle Help button click."""
         try:
-            help_text = HELP_FILE.read_text(encoding="utf-8")
+            help_text = await AsyncExecutor.run(_load_markdown, HELP_FILE)
         except (FileNotFoundError, OSError) as e:
             help_text = """# UV Forger Help
 
@@ -106,7 +144,7 @@ For more information, visit: https://docs.astral.sh/uv/
     async def on_app_cheat_sheet_click(self, e: ft.ControlEvent) -> None:
         """Handle App Cheat Sheet button click."""
         try:
-            content = APP_CHEAT_SHEET_FILE.read_text(encoding="utf-8")
+            content = await AsyncExecutor.run(_load_markdown, APP_CHEAT_SHEET_FILE)
         except (FileNotFoundError, OSError) as e:
             content = "# App Cheat Sheet\n\nError: Could not load cheat sheet file."
             self._set_status(
@@ -145,7 +183,7 @@ For more information, visit: https://docs.astral.sh/uv/
         dialog and open the corresponding dialog directly.
         """
         try:
-            content = ABOUT_FILE.read_text(encoding="utf-8")
+            content = await AsyncExecutor.run(_load_markdown, ABOUT_FILE)
         except (FileNotFoundError, OSError) as e:
             content = "# UV Forger\n\nError: Could not load about file."
             self._set_status(
@@ -320,7 +320,10 @@ class FolderHandlersMixin:
 
     @staticmethod
     def _count_folders_and_files(folders: list[dict[str, Any]]) -> tuple[int, int]:
-        """Recursively count folders and files in a normalized folder structure.
+        """Count folders and files in a normalized folder structure.
+
+        Walks the tree iteratively with an explicit stack; traversal order
+        does not affect the totals.
 
         Args:
             folders: List of normalized folder dicts.
@@ -330,17 +333,15 @@ class FolderHandlersMixin:
         """
         folder_count = 0
         file_count = 0
+        pending = list(folders)
 
-        for folder in folders:
+        while pending:
+            folder = pending.pop()
             folder_count += 1
             if folder.get("create_init", True):
                 file_count += 1  # __init__.py
-            file_count += len(folder.get("files", []) or [])
-            subfolders = folder.get("subfolders", []) or []
-            if subfolders:
-                sub_f, sub_fi = FolderHandlersMixin._count_folders_and_files(subfolders)
-                folder_count += sub_f
-                file_count += sub_fi
+            file_count += len(folder.get("files") or ())
+            pending.extend(folder.get("subfolders") or ())
 
         return folder_count, file_count
 
@@ -39,20 +39,26 @@ class HandlerBase:
     def _set_validation_icon(field: ft.TextField, is_valid: bool | None) -> None:
         """Set a validation icon on a text field.
 
+        Called on every keystroke, so an Icon already attached to the field is
+        updated in place rather than replaced. Each field keeps its own Icon;
+        Flet controls must not be shared between parents.
+
         Args:
             field: The TextField to set the icon on.
             is_valid: True for green check, False for red X, None to clear.
         """
         if is_valid is None:
             field.suffix = None
-        elif is_valid:
-            field.suffix = ft.Icon(
-                ft.Icons.CHECK_CIRCLE, color=UIConfig.COLOR_VALIDATION_OK
-            )
+            return
+        if is_valid:
+            icon, color = ft.Icons.CHECK_CIRCLE, UIConfig.COLOR_VALIDATION_OK
+        else:
+            icon, color = ft.Icons.CANCEL, UIConfig.COLOR_VALIDATION_ERROR
+        if isinstance(field.suffix, ft.Icon):
+            field.suffix.icon = icon
+            field.suffix.color = color
         else:
-            field.suffix = ft.Icon(
-                ft.Icons.CANCEL, color=UIConfig.COLOR_VALIDATION_ERROR
-            )
+            field.suffix = ft.Icon(icon, color=color)
 
     def _update_preset_button_state(self) -> None:
         """Enable Save as Preset button when there's meaningful config to save.
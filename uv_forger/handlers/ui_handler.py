@@ -4,6 +4,8 @@ This module composes handler mixins into a single Handlers class and
 provides the attach_handlers() function that wires all UI controls.
 """
 
+import asyncio
+
 import flet as ft
 
 from uv_forger.core.settings_manager import get_user_templates_dir
@@ -68,6 +70,9 @@ def attach_handlers(page: ft.Page, state: AppState) -> None:
     handlers._reload_and_merge_templates()
     handlers._update_metadata_summary()
 
+    # Read the help/about markdown files off the event loop
+    asyncio.create_task(handlers.prewarm_markdown())
+
     # Set initial UI state (path icon if default path exists, button disabled)
     if state.path_valid:
         handlers._set_validation_icon(controls.project_path_input, True)
@@ -7,8 +7,15 @@ package installation.
 
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+from uv_forger.core.constants import (
+    DEFAULT_ENTRY_POINT,
+    FRAMEWORK_ENTRY_POINT_MAP,
+    PROJECT_TYPE_ENTRY_POINT_MAP,
+)
+
 
 def get_uv_path() -> str:
     """Get the full path to the uv executable.
@@ -134,6 +141,7 @@ def install_packages(
     )
 
 
+@lru_cache(maxsize=64)
 def _resolve_entry_point(
     framework: str | None = None,
     project_type: str | None = None,
@@ -142,7 +150,8 @@ def _resolve_entry_point(
 
     Priority: framework > project_type > default.
     Returns None when the project type/framework has its own runner
-    (e.g., Django, FastAPI, Streamlit).
+    (e.g., Django, FastAPI, Streamlit). Cached, since the input domain is
+    the small set of known frameworks and project types.
 
     Args:
         framework: UI framework name, or None.
@@ -151,12 +160,6 @@ def _resolve_entry_point(
     Returns:
         Entry point string like "app.main:main", or None if no scripts section needed.
     """
-    from uv_forger.core.constants import (
-        DEFAULT_ENTRY_POINT,
-        FRAMEWORK_ENTRY_POINT_MAP,
-        PROJECT_TYPE_ENTRY_POINT_MAP,
-    )
-
     if framework is not None:
         return FRAMEWORK_ENTRY_POINT_MAP.get(framework, DEFAULT_ENTRY_POINT)
     if project_type is not None:
@@ -201,14 +204,32 @@ def configure_pyproject(
         pyproject_file.write_text(content, encoding="utf-8")
 
     # Append hatch build config and entry point
+    with open(pyproject_file, "a", encoding="utf-8") as f:
+        f.write(_build_pyproject_appendix(project_name, framework, project_type))
+
+
+def _build_pyproject_appendix(
+    project_name: str,
+    framework: str | None,
+    project_type: str | None,
+) -> str:
+    """Build the text appended to pyproject.toml by configure_pyproject.
+
+    Args:
+        project_name: Name of the project for the entry point script.
+        framework: UI framework name, or None.
+        project_type: Project type name, or None.
+
+    Returns:
+        Hatch build configuration, followed by a [project.scripts] section
+        when the project has an entry point. Starts with a newline.
+    """
     entry_point = _resolve_entry_point(framework, project_type)
 
     config = '\n[tool.hatch.build.targets.wheel]\npackages = ["app"]\n'
     if entry_point is not None:
         config += f'\n[project.scripts]\n{project_name} = "{entry_point}"\n'
-
-    with open(pyproject_file, "a") as f:
-        f.write(config)
+    return config
 
 
 def _apply_metadata_to_pyproject(
@@ -334,6 +334,20 @@ def _create_none_option_container(is_dark_mode: bool) -> list[ft.Control]:
     ]
 
 
+# Log level colours and text styling for the log viewer. Only INFO differs
+# between themes; built once here rather than on every parsed line.
+_LOG_LEVEL_COLORS_DARK = {
+    "DEBUG": ft.Colors.GREY_600,
+    "INFO": ft.Colors.GREY_400,
+    "SUCCESS": ft.Colors.GREEN_400,
+    "WARNING": ft.Colors.AMBER_400,
+    "ERROR": ft.Colors.RED_400,
+    "CRITICAL": ft.Colors.RED_300,
+}
+_LOG_LEVEL_COLORS_LIGHT = {**_LOG_LEVEL_COLORS_DARK, "INFO": ft.Colors.GREY_700}
+_LOG_TEXT_KWARGS = {"font_family": "monospace", "size": 11, "no_wrap": True}
+
+
 def _parse_log_location(location: str) -> tuple[str, int] | None:
     """Extract module path and line number from a log location segment.
 
@@ -370,16 +384,8 @@ def _parse_log_line(
     Returns:
         A Row with coloured Text segments for each part of the log line.
     """
-    level_colors = {
-        "DEBUG": ft.Colors.GREY_600,
-        "INFO": ft.Colors.GREY_400 if is_dark_mode else ft.Colors.GREY_700,
-        "SUCCESS": ft.Colors.GREEN_400,
-        "WARNING": ft.Colors.AMBER_400,
-        "ERROR": ft.Colors.RED_400,
-        "CRITICAL": ft.Colors.RED_300,
-    }
-
-    text_kwargs = {"font_family": "monospace", "size": 11, "no_wrap": True}
+    level_colors = _LOG_LEVEL_COLORS_DARK if is_dark_mode else _LOG_LEVEL_COLORS_LIGHT
+    text_kwargs = _LOG_TEXT_KWARGS
 
     parts = line.split(" | ", 2)
     if len(parts) != 3: